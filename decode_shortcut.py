@@ -12,39 +12,360 @@ Usage:
     python decode_shortcut.py -A My.shortcut
     python decode_shortcut.py -B My.shortcut
     python decode_shortcut.py -C My1.shortcut My2.shortcut
+    python decode_shortcut.py -C --strict My.shortcut
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import functools
+import io
+import mmap
+import os
 import plistlib
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 
-# Pure-Python ASN.1 library (installed via pip)
-from asn1crypto import cms
-
 try:
     import lzfse
 except ModuleNotFoundError:  # pragma: no cover - dependency hint for users
     lzfse = None
 
 
-def extract_cms_payload(shortcut_path: Path) -> bytes:
-    """Extract the inner plist payload from a CMS-wrapped .shortcut file."""
-    data = shortcut_path.read_bytes()
-    content_info = cms.ContentInfo.load(data)
+@functools.lru_cache(maxsize=None)
+def _load_liblzfse():
+    """
+    Bind lzfse_decode_buffer() from the reference liblzfse C library, if installed.
 
-    if content_info['content_type'].native != 'signed_data':
+    Only called when the lzfse module is missing, and cached: find_library()
+    shells out to ldconfig/gcc, which costs far more than decoding a shortcut.
+    """
+    lib_path = ctypes.util.find_library("lzfse")
+    if lib_path is None:
+        if sys.platform != "darwin":
+            return None
+        # find_library() on macOS does not search Homebrew's Apple Silicon prefix
+        lib_path = os.path.join(os.environ.get("HOMEBREW_PREFIX", "/opt/homebrew"), "lib", "liblzfse.dylib")
+
+    try:
+        lib = ctypes.CDLL(lib_path)
+    except OSError:  # broken or foreign-architecture install, or no Homebrew copy
+        return None
+
+    decode = lib.lzfse_decode_buffer
+    decode.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_void_p]
+    decode.restype = ctypes.c_size_t
+    return decode
+
+
+# DER tags used while walking the CMS envelope
+_INTEGER = 0x02
+_OCTET_STRING = 0x04
+_CONSTRUCTED_OCTET_STRING = 0x24
+_OID = 0x06
+_SEQUENCE = 0x30
+_SET = 0x31
+_EXPLICIT_0 = 0xA0
+
+# Content of the OID 1.2.840.113549.1.7.2 (id-signedData), and its full DER encoding
+_SIGNED_DATA_OID = b"\x2a\x86\x48\x86\xf7\x0d\x01\x07\x02"
+_SIGNED_DATA_OID_DER = bytes([_OID, len(_SIGNED_DATA_OID)]) + _SIGNED_DATA_OID
+
+# Little-endian integers in the AEA1 and Apple Archive headers
+_U16LE = struct.Struct("<H")
+_U32LE = struct.Struct("<I")
+_U32LE_PAIR = struct.Struct("<II")
+_U64LE = struct.Struct("<Q")
+
+# Container, compressed block and plist magics checked on every file
+_AEA1 = b"AEA1"
+_BVX = b"bvx"
+_BPLIST = b"bplist00"
+_AA01 = b"AA01"
+
+# Apple Archive header fields are a 3-letter key plus a type letter giving the
+# value's size; blob fields ("A"/"B"/"C") hold only the blob's length, and the
+# blobs themselves follow the header in field order
+_AA_FIXED_FIELD_SIZES = {
+    ord("*"): 0, ord("1"): 1, ord("2"): 2, ord("4"): 4, ord("8"): 8,
+    ord("S"): 8, ord("T"): 12,
+    ord("F"): 4, ord("G"): 20, ord("H"): 32, ord("I"): 48, ord("J"): 64,
+}
+_AA_BLOB_LENGTH_SIZES = {ord("A"): 2, ord("B"): 4, ord("C"): 8}
+_AA_STRING = ord("P")
+_AA_REGULAR_FILE = ord("F")
+
+
+class DERReader:
+    """
+    Minimal DER/BER tag-length-value reader over a zero-copy buffer view.
+
+    BER indefinite-length elements are handled lazily: their value view runs
+    to the end of the buffer (a reader over it stops at the end-of-contents
+    marker), and their real end is only searched for if this reader is asked
+    to move past them.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+        # Where the contents of an indefinite-length element we have not yet skipped start
+        self._indefinite_start = None
+
+    def is_empty(self) -> bool:
+        self._skip_indefinite()
+        return self.pos >= len(self.data) or self.at_end_of_contents()
+
+    def at_end_of_contents(self) -> bool:
+        return self.data[self.pos:self.pos + 2] == b"\x00\x00"
+
+    def read_header(self):
+        """Read the next element's header and return ``(tag, length)``; ``length`` is None if indefinite."""
+        self._skip_indefinite()
+        return self._read_header()
+
+    def read_tlv(self):
+        """Read the next element and return ``(tag, length, value)``."""
+        tag, length = self.read_header()
+        pos = self.pos
+        if length is None:
+            self._indefinite_start = pos
+            return tag, length, self.data[pos:]
+
+        self.pos = pos + length
+        return tag, length, self.data[pos:self.pos]
+
+    def skip_exact(self, encoding: bytes) -> bool:
+        """Consume ``encoding`` if it is exactly what comes next; report whether it was."""
+        self._skip_indefinite()
+        end = self.pos + len(encoding)
+        if self.data[self.pos:end] != encoding:
+            return False
+        self.pos = end
+        return True
+
+    def read_element(self, expected_tag: int) -> memoryview:
+        """Read the next element, requiring it to carry ``expected_tag``."""
+        tag, _, value = self.read_tlv()
+        if tag != expected_tag:
+            raise ValueError(f"Expected DER tag 0x{expected_tag:02x}, found 0x{tag:02x}")
+        return value
+
+    def _read_header(self):
+        data = self.data
+        pos = self.pos
+        if pos + 2 > len(data):
+            raise ValueError("Truncated DER element")
+
+        tag = data[pos]
+        if tag & 0x1F == 0x1F:
+            raise ValueError("High-tag-number DER elements are not supported")
+
+        length = data[pos + 1]
+        pos += 2
+
+        if length == 0x80:
+            if not tag & 0x20:
+                raise ValueError("Indefinite length on a primitive DER element")
+            self.pos = pos
+            return tag, None
+
+        if length & 0x80:
+            num_bytes = length & 0x7F
+            if num_bytes > 4 or pos + num_bytes > len(data):
+                raise ValueError("Invalid DER length")
+            length = int.from_bytes(data[pos:pos + num_bytes], "big")
+            pos += num_bytes
+
+        if pos + length > len(data):
+            raise ValueError("Truncated DER element")
+
+        self.pos = pos
+        return tag, length
+
+    def _skip_indefinite(self):
+        """Move past the pending indefinite-length element, if any."""
+        if self._indefinite_start is None:
+            return
+        self.pos = self._indefinite_start
+        self._indefinite_start = None
+
+        # Only headers at indefinite-length levels are read; definite-length
+        # children are stepped over whole
+        depth = 1
+        while depth:
+            if self.at_end_of_contents():
+                self.pos += 2
+                depth -= 1
+                continue
+            _, length = self._read_header()
+            if length is None:
+                depth += 1
+            else:
+                self.pos += length
+
+
+def _octet_string_bytes(tag: int, length, value: memoryview) -> bytes:
+    """Return the contents of a primitive or (BER) constructed OCTET STRING."""
+    if tag == _OCTET_STRING:
+        return bytes(value)
+
+    if tag != _CONSTRUCTED_OCTET_STRING:
+        raise ValueError(f"Expected OCTET STRING, found DER tag 0x{tag:02x}")
+
+    # Collect the primitive chunks in a single forward pass, entering nested
+    # constructed strings in place. Each entry in ends is the offset where an
+    # open string finishes, or None if it runs to an end-of-contents marker.
+    reader = DERReader(value)
+    ends = [length]
+    chunks = []
+    while ends:
+        end = ends[-1]
+        if end is None and reader.at_end_of_contents():
+            reader.pos += 2
+            ends.pop()
+            continue
+        if end is not None and reader.pos >= end:
+            ends.pop()
+            continue
+
+        chunk_tag, chunk_length = reader.read_header()
+        if chunk_tag == _CONSTRUCTED_OCTET_STRING:
+            ends.append(None if chunk_length is None else reader.pos + chunk_length)
+        elif chunk_tag == _OCTET_STRING:
+            chunks.append(reader.data[reader.pos:reader.pos + chunk_length])
+            reader.pos += chunk_length
+        else:
+            raise ValueError(f"Expected OCTET STRING chunk, found DER tag 0x{chunk_tag:02x}")
+    return b"".join(chunks)
+
+
+@contextmanager
+def map_shortcut(shortcut_path: Path):
+    """Map a shortcut file read-only so parsers can view it without copying."""
+    with shortcut_path.open("rb") as f:
+        # Parsing moves forward through the file, so ask for aggressive readahead.
+        # Neither hint exists everywhere (macOS has no posix_fadvise, but reads
+        # ahead by default).
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        data.madvise(mmap.MADV_SEQUENTIAL)
+
+    try:
+        yield data
+    finally:
+        try:
+            data.close()
+        except BufferError:
+            # A traceback still holds views into the map; it is unmapped once they are freed
+            pass
+
+
+def extract_cms_payload(shortcut_path: Path, strict: bool = False) -> bytes:
+    """
+    Extract the inner plist payload from a CMS-wrapped .shortcut file.
+
+    By default only the path down to encapContentInfo.content is walked; the
+    certificates and signer infos are never parsed. With ``strict`` the whole
+    structure is loaded with asn1crypto instead.
+    """
+    with map_shortcut(shortcut_path) as data:
+        if strict:
+            # asn1crypto only accepts real bytes objects
+            return extract_cms_payload_asn1crypto(bytes(data))
+        return extract_cms_payload_der(data)
+
+
+def extract_cms_payload_der(data) -> bytes:
+    """
+    Walk a CMS envelope in ``data`` down to its embedded content.
+
+    For DER input only a fixed handful of element headers are read, whatever
+    the size of the certificates or payload; the final copy of the payload
+    is the only part that scales with the input. BER indefinite-length
+    encodings add a header scan of any such element the walk has to step
+    over (in practice digestAlgorithms) and of the chunks of a constructed
+    payload, but the certificates and signer infos are still never read.
+    """
+    # ContentInfo ::= SEQUENCE { contentType OID, content [0] EXPLICIT ANY }
+    content_info = DERReader(DERReader(data).read_element(_SEQUENCE))
+    if not content_info.skip_exact(_SIGNED_DATA_OID_DER):
         raise ValueError("File is not CMS signedData")
 
-    signed_data = content_info['content']
+    # SignedData ::= SEQUENCE { version, digestAlgorithms, encapContentInfo, ... }
+    content = DERReader(content_info.read_element(_EXPLICIT_0))
+    signed_data = DERReader(content.read_element(_SEQUENCE))
+    signed_data.read_element(_INTEGER)
+    signed_data.read_element(_SET)
+
+    # EncapsulatedContentInfo ::= SEQUENCE { eContentType OID, eContent [0] EXPLICIT OCTET STRING OPTIONAL }
+    encap = DERReader(signed_data.read_element(_SEQUENCE))
+    encap.read_element(_OID)
+
+    if encap.is_empty():
+        raise ValueError("Shortcut contains no embedded plist content")
+
+    return _octet_string_bytes(*DERReader(encap.read_element(_EXPLICIT_0)).read_tlv())
+
+
+def extract_cms_payload_asn1crypto(data: bytes) -> bytes:
+    """Extract the CMS payload by fully parsing and validating it with asn1crypto."""
+    try:
+        # Pure-Python ASN.1 library, only needed for --strict; importing it costs more than the DER walk
+        from asn1crypto import cms, core
+    except ModuleNotFoundError:
+        raise ValueError("Missing dependency: install asn1crypto to use --strict")
+
+    content_info = cms.ContentInfo.load(data)
+
+    # Compare the encoded OID rather than mapping it to a name through .native
+    if content_info['content_type'].contents != _SIGNED_DATA_OID:
+        raise ValueError("File is not CMS signedData")
 
-    # Per CMS spec, content is inside encap_content_info
-    encap = signed_data['encap_content_info']
+    # Per CMS spec, content is inside encap_content_info; descend to it once
+    content = content_info['content']['encap_content_info']['content']
 
-    if encap['content'] is None:
+    # asn1crypto returns Void, not None, for the absent optional field
+    if isinstance(content, core.Void):
         raise ValueError("Shortcut contains no embedded plist content")
 
-    return encap['content'].native
+    # A primitive OCTET STRING's raw contents are the payload; only BER
+    # constructed encodings need their chunks merged
+    if content.method == 0:
+        return content.contents
+    return bytes(content)
+
+
+def lzfse_decompress_into(compressed: bytes, out: bytearray) -> int:
+    """Decompress into ``out`` with liblzfse, returning the number of bytes written."""
+    dst = (ctypes.c_char * len(out)).from_buffer(out)
+    return _load_liblzfse()(dst, len(out), compressed, len(compressed), None)
+
+
+def lzfse_decompress(compressed: bytes, raw_size: int):
+    """
+    Decompress an LZFSE stream of known size, returning ``(buffer, length)``.
+
+    The lzfse module's decompress() is used when installed. Otherwise liblzfse
+    decodes once into a bytearray sized from ``raw_size``, with one spare byte
+    so that a stream longer than announced shows up as a size mismatch.
+    """
+    if lzfse is not None:
+        decompressed = lzfse.decompress(compressed)
+        length = len(decompressed)
+    else:
+        decompressed = bytearray(raw_size + 1)
+        length = lzfse_decompress_into(compressed, decompressed)
+
+    if length != raw_size:
+        raise ValueError("LZFSE payload size does not match the AEA1 header")
+    return decompressed, length
 
 
 def extract_aea1_lzfse_payload(shortcut_path: Path) -> bytes:
@@ -52,37 +373,141 @@ def extract_aea1_lzfse_payload(shortcut_path: Path) -> bytes:
     Extract the inner plist payload from Apple's newer AEA1 container that
     wraps an LZFSE-compressed plist.
     """
-    if lzfse is None:
+    if lzfse is None and _load_liblzfse() is None:
         raise ValueError("Missing dependency: install lzfse to parse AEA1 shortcuts")
 
-    data = shortcut_path.read_bytes()
+    with map_shortcut(shortcut_path) as data:
+        return extract_aea1_lzfse_payload_from(data)
+
+
+def parse_aea1_header(data):
+    """
+    Validate an AEA1 header in ``data`` and locate its LZFSE block.
 
-    if not data.startswith(b"AEA1"):
+    Returns ``(lzfse_start, lzfse_len, raw_size)``: the block's offset, and its
+    compressed and decompressed sizes from the first segment header. Only
+    offsets are computed here, the caller does any slicing.
+    """
+    if data[:len(_AEA1)] != _AEA1:
         raise ValueError("Not an AEA1/LZFSE shortcut")
+    if len(data) < 12:
+        raise ValueError("Truncated AEA1 header")
 
     # First 4 bytes: magic "AEA1"
-    # Next 4 bytes: unused/reserved (currently zeros)
+    # Next 4 bytes: little-endian 24-bit profile ID, then the scrypt strength
     # Next 4 bytes: little-endian length of the signing certificate plist
-    cert_len = int.from_bytes(data[8:12], "little")
+    # The offsets below are those of profile 0 (signed, not encrypted), which
+    # is what Shortcuts exports; other profiles lay the payload out differently
+    if _U32LE.unpack_from(data, 4)[0] & 0xFFFFFF != 0:
+        raise ValueError("Unsupported AEA1 profile")
+    cert_len = _U32LE.unpack_from(data, 8)[0]
 
     # The certificate chain plist is rarely useful for decoding, but we skip
     # past it to reach the payload section.
     payload_start = 12 + cert_len
 
+    # The payload section opens with a 128-byte signature and three 32-byte
+    # salt/MAC fields, then the 48-byte root header. Its little-endian
+    # segments-per-cluster count (offset 20) sizes the cluster header that
+    # follows: a 32-byte MAC, a 40-byte header per segment, the next cluster's
+    # 32-byte MAC and a 32-byte MAC per segment.
+    root_header = payload_start + 224
+    first_segment_header = root_header + 48 + 32
+    if len(data) < first_segment_header + 8:
+        raise ValueError("Truncated AEA1 header")
+    raw_size = _U64LE.unpack_from(data, root_header)[0]
+    segments_per_cluster = _U32LE.unpack_from(data, root_header + 20)[0]
+
+    # Each segment header starts with the segment's raw and compressed sizes
+    segment_raw_size, segment_size = _U32LE_PAIR.unpack_from(data, first_segment_header)
+    if segment_raw_size != raw_size:
+        raise ValueError("Multi-segment AEA1 containers are not supported")
+
     # The actual workflow payload is stored in an LZFSE-compressed block
-    # flagged by the "bvx" magic. Grab from that magic onward.
-    magic_index = data.find(b"bvx", payload_start)
-    if magic_index == -1:
+    # flagged by the "bvx" magic, right at the start of the first segment.
+    magic_index = first_segment_header + 72 * segments_per_cluster + 32
+    if data[magic_index:magic_index + len(_BVX)] != _BVX:
         raise ValueError("LZFSE section not found inside AEA1 container")
+    if magic_index + segment_size > len(data):
+        raise ValueError("Truncated AEA1 payload")
+
+    return magic_index, segment_size, segment_raw_size
 
-    compressed = data[magic_index:]
-    decompressed = lzfse.decompress(compressed)
 
-    plist_index = decompressed.find(b"bplist00")
-    if plist_index == -1:
+def find_apple_archive_file(archive, length: int):
+    """
+    Locate the first regular file's DATA blob in an Apple Archive (AA01)
+    held in ``archive[:length]``.
+
+    Returns ``(start, size)``; only entry headers are read.
+    """
+    pos = 0
+    while pos + 6 <= length:
+        if archive[pos:pos + len(_AA01)] != _AA01:
+            raise ValueError("Malformed Apple Archive entry")
+
+        header_size = _U16LE.unpack_from(archive, pos + 4)[0]
+        if header_size < 6:
+            # The size covers the magic and itself; anything smaller would never advance
+            raise ValueError("Malformed Apple Archive entry")
+
+        header_end = pos + header_size
+        if header_end > length:
+            raise ValueError("Truncated Apple Archive entry")
+
+        field = pos + 6
+        blob_start = header_end
+        entry_type = file_data = None
+
+        while field + 4 <= header_end:
+            key, field_type = archive[field:field + 3], archive[field + 3]
+            field += 4
+
+            if field_type in _AA_BLOB_LENGTH_SIZES:
+                size_len = _AA_BLOB_LENGTH_SIZES[field_type]
+                blob_size = int.from_bytes(archive[field:field + size_len], "little")
+                if key == b"DAT":
+                    file_data = (blob_start, blob_size)
+                blob_start += blob_size
+                field += size_len
+            elif field_type == _AA_STRING:
+                field += 2 + _U16LE.unpack_from(archive, field)[0]
+            elif field_type in _AA_FIXED_FIELD_SIZES:
+                if key == b"TYP":
+                    entry_type = archive[field]
+                field += _AA_FIXED_FIELD_SIZES[field_type]
+            else:
+                raise ValueError(f"Unknown Apple Archive field type {chr(field_type)!r}")
+
+        if entry_type == _AA_REGULAR_FILE and file_data is not None:
+            if file_data[0] + file_data[1] > length:
+                raise ValueError("Truncated Apple Archive entry")
+            return file_data
+
+        # Blobs follow their header, so the next entry starts after the last one
+        if blob_start <= pos:
+            raise ValueError("Malformed Apple Archive entry")
+        pos = blob_start
+
+    raise ValueError("No file found in Apple Archive")
+
+
+def extract_aea1_lzfse_payload_from(data) -> bytes:
+    """Extract the plist payload from an AEA1 container held in ``data``."""
+    lzfse_start, lzfse_len, raw_size = parse_aea1_header(data)
+
+    # The decoders need a real bytes object, so this is the one copy taken of the file
+    compressed = data[lzfse_start:lzfse_start + lzfse_len]
+    decompressed, length = lzfse_decompress(compressed, raw_size)
+
+    # The decompressed segment is an Apple Archive: a directory entry, then the
+    # Shortcut.wflow file entry whose DATA blob is the plist
+    plist_start, plist_len = find_apple_archive_file(decompressed, length)
+    plist_end = plist_start + plist_len
+    if not decompressed.startswith(_BPLIST, plist_start, plist_end):
         raise ValueError("Embedded plist not found after decompressing AEA1 payload")
 
-    return decompressed[plist_index:]
+    return bytes(memoryview(decompressed)[plist_start:plist_end])
 
 
 def decode_plist_to_dict(plist_bytes: bytes) -> dict:
@@ -94,38 +519,70 @@ def decode_plist_to_dict(plist_bytes: bytes) -> dict:
 
 
 def write_xml_plist(plist_dict: dict, output_path: Path):
-    """Write plist dict as XML."""
-    xml_data = plistlib.dumps(plist_dict, fmt=plistlib.FMT_XML)
-    output_path.write_bytes(xml_data)
+    """Write plist dict as XML, streaming it to the file rather than building it in memory."""
+    # Keys stay sorted: action order lives in a list, and sorted dicts keep the XML diffable
+    with output_path.open("wb") as f:
+        plistlib.dump(plist_dict, f, fmt=plistlib.FMT_XML)
+
+
+# The only keys render_action_list reads from each action
+_ID_KEY = "WFWorkflowActionIdentifier"
+_PARAMS_KEY = "WFWorkflowActionParameters"
+
+
+_BYTES_PREVIEW = 32
 
 
-def render_action_list(plist_dict: dict) -> str:
-    """Produce a clean, readable human-oriented description of workflow actions."""
+def _format_bytes(value: bytes) -> str:
+    """Render a data blob as a short hex preview instead of its full bytes repr."""
+    if len(value) <= _BYTES_PREVIEW:
+        return value.hex()
+    return f"{value[:_BYTES_PREVIEW].hex()}... ({len(value)} bytes)"
+
+
+# Parameter value formatters keyed by exact type; anything else renders with str().
+# Dicts and lists stay in full since they carry the variable and intent wiring.
+_VALUE_FORMATTERS = {bytes: _format_bytes}
+
+
+def render_action_list(plist_dict: dict) -> bytearray:
+    """
+    Produce a clean, readable human-oriented description of workflow actions,
+    encoded as UTF-8.
+    """
     wf = plist_dict.get("WFWorkflow") or plist_dict  # Some versions have nested WFWorkflow key
 
     actions = wf.get("WFWorkflowActions", [])
-    output_lines = []
+
+    # Each action's block is encoded straight into the output buffer, so the
+    # whole listing never exists as one large str
+    buf = bytearray()
+    formatter_for = _VALUE_FORMATTERS.get
 
     for i, action in enumerate(actions, start=1):
-        action_type = action.get("WFWorkflowActionIdentifier", "UnknownAction")
-        params = action.get("WFWorkflowActionParameters", {})
+        act_get = action.get
+        action_type = act_get(_ID_KEY, "UnknownAction")
+        params = act_get(_PARAMS_KEY) or {}
 
-        output_lines.append(f"\n=== Action {i}: {action_type} ===")
+        header = f"\n=== Action {i}: {action_type} ==="
 
         if params:
-            for k, v in params.items():
-                output_lines.append(f"{k}: {v}")
+            block = "\n".join([header, *(f"{k}: {formatter_for(type(v), str)(v)}" for k, v in params.items())])
         else:
-            output_lines.append("(No parameters)")
+            block = f"{header}\n(No parameters)"
+
+        if buf:
+            buf += b"\n"
+        buf += block.encode("utf-8")
 
-    return "\n".join(output_lines)
+    return buf
 
 
-def process_shortcut(path: Path, do_xml: bool, do_actions: bool):
+def process_shortcut(path: Path, do_xml: bool, do_actions: bool, strict: bool = False):
     print(f"\nProcessing: {path}")
 
     try:
-        payload = extract_cms_payload(path)
+        payload = extract_cms_payload(path, strict=strict)
     except Exception as e:
         try:
             payload = extract_aea1_lzfse_payload(path)
@@ -133,6 +590,7 @@ def process_shortcut(path: Path, do_xml: bool, do_actions: bool):
             print(f"ERROR: Failed to extract shortcut payload.\n- CMS parse error: {e}\n- AEA1 parse error: {e2}")
             return
 
+    # This is the only decode of the payload; with -C both outputs share the result
     try:
         plist_dict = decode_plist_to_dict(payload)
     except Exception as e:
@@ -151,10 +609,22 @@ def process_shortcut(path: Path, do_xml: bool, do_actions: bool):
     if do_actions:
         txt_path = path.with_suffix(".actions.txt")
         readable = render_action_list(plist_dict)
-        txt_path.write_text(readable, encoding="utf-8")
+        txt_path.write_bytes(readable)
         print(f"→ Action list written to {txt_path}")
 
 
+def process_shortcut_captured(path: Path, **options) -> str:
+    """Run process_shortcut in a worker process and return what it printed."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            process_shortcut(path, **options)
+        except Exception as e:
+            # Keep what was already printed for this file, as a serial run would
+            print(f"ERROR: Failed to process {path}: {e}")
+    return output.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Decode .shortcut files")
     parser.add_argument(
@@ -180,23 +650,55 @@ def main():
         action="store_true",
         help="Produce BOTH XML and action list",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fully parse and validate the CMS envelope with asn1crypto (slower)",
+    )
     args = parser.parse_args()
 
     if not (args.xml or args.actions or args.both):
         print("ERROR: You must specify -A, -B, or -C.")
         sys.exit(1)
 
-    for file_path in args.files:
-        path = Path(file_path)
+    options = dict(
+        do_xml=(args.xml or args.both),
+        do_actions=(args.actions or args.both),
+        strict=args.strict,
+    )
+    paths = [Path(file_path) for file_path in args.files]
+
+    if len(paths) == 1:
+        path = paths[0]
         if not path.exists():
             print(f"ERROR: File not found: {path}")
-            continue
+            return
+
+        process_shortcut(path, **options)
+        return
 
-        process_shortcut(
-            path,
-            do_xml=(args.xml or args.both),
-            do_actions=(args.actions or args.both),
-        )
+    # Each file decodes independently and the parsing is pure Python, so fan
+    # out across processes and print the results back in command-line order.
+    with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(process_shortcut_captured, path, **options) if path.exists() else None
+            for path in paths
+        ]
+
+        for path, future in zip(paths, futures):
+            if future is None:
+                print(f"ERROR: File not found: {path}")
+                continue
+
+            # Failures inside process_shortcut come back in the output; this only
+            # catches a worker dying, which must not lose the other files' output
+            try:
+                output = future.result()
+            except Exception as e:
+                print(f"ERROR: Failed to process {path}: {e}")
+                continue
+
+            print(output, end="")
 
 
 if __name__ == "__main__":